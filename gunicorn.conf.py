@@ -0,0 +1,141 @@
+# ------------------------------------------
+# Gunicorn 설정 (Dockerfile CMD 에서 -c gunicorn.conf.py 로 로드)
+# - access log 를 python-json-logger 로 JSON 한 줄씩 stdout 에 출력 (stdout 에는 JSON 만)
+# - 요청마다 X-Request-ID 를 보장 (없으면 생성) → 앱/액세스 로그에서 trace_id 로 사용
+# - /health 등 고빈도 경로는 access log 에서 제외, 나머지는 샘플링 가능
+# - access log 는 큐에 넣고 워커별 별도 스레드에서 기록 (요청 처리 중 stdout 쓰기 없음)
+# ------------------------------------------
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+
+from gunicorn.glogging import Logger
+from pythonjsonlogger import jsonlogger
+
+REQUEST_ID_HEADER = "X-REQUEST-ID"
+# 클라이언트가 보낸 값은 이 형식일 때만 그대로 사용, 아니면 새로 발급
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+# access log 에서 제외할 경로 (쉼표 구분, 기본: readiness probe 가 5초마다 호출하는 /health)
+ACCESS_LOG_SKIP_PATHS = frozenset(
+    p.strip() for p in os.environ.get("ACCESS_LOG_SKIP_PATHS", "/health").split(",") if p.strip()
+)
+# 2xx/3xx 응답의 기록 비율 (0.0 ~ 1.0). 4xx/5xx 는 경로/비율과 무관하게 항상 기록
+ACCESS_LOG_SAMPLE_RATE = float(os.environ.get("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+
+
+def json_formatter():
+    return jsonlogger.JsonFormatter("%(asctime)s %(message)s", json_ensure_ascii=False)
+
+
+# 워커 프로세스마다 post_fork 에서 시작 (fork 이전에 만든 스레드는 자식에 복제되지 않음)
+_access_queue = queue.Queue(-1)
+_access_stream = logging.StreamHandler(sys.stdout)
+_access_stream.setFormatter(json_formatter())
+_access_listener = QueueListener(_access_queue, _access_stream)
+
+
+def _access_queue_handler():
+    return QueueHandler(_access_queue)
+
+
+def pre_request(worker, req):
+    """WSGI environ 생성 전에 호출됨 → 앱에서는 HTTP_X_REQUEST_ID 로 보인다."""
+    worker.log.debug("%s %s", req.method, req.path)
+    values = [v for k, v in req.headers if k == REQUEST_ID_HEADER]
+    if len(values) == 1 and _REQUEST_ID_RE.match(values[0]):
+        return
+    req.headers = [(k, v) for k, v in req.headers if k != REQUEST_ID_HEADER]
+    req.headers.append((REQUEST_ID_HEADER, uuid.uuid4().hex))
+
+
+def post_fork(server, worker):
+    # gevent monkey patch(init_process) 이전에 시작 → 실제 OS 스레드가 stdout 에 기록
+    _access_listener.start()
+
+
+def worker_exit(server, worker):
+    # 큐에 남은 access log 를 비우고 종료
+    _access_listener.stop()
+
+
+def should_log(path, status):
+    if status >= 400:
+        return True
+    if path in ACCESS_LOG_SKIP_PATHS:
+        return False
+    return ACCESS_LOG_SAMPLE_RATE >= 1.0 or random.random() < ACCESS_LOG_SAMPLE_RATE
+
+
+class JsonAccessLogger(Logger):
+    """access log 필드를 format 문자열이 아니라 레코드 속성(extra)으로 넘긴다.
+
+    직렬화/이스케이프는 JsonFormatter 가 담당하므로 path, query, 헤더 값에
+    역슬래시나 개행이 있어도 JSON 한 줄이 깨지지 않는다.
+    """
+
+    def access(self, resp, req, environ, request_time):
+        try:
+            atoms = self.atoms(resp, req, environ, request_time)
+            status = int(atoms["s"])
+            if not should_log(atoms["U"], status):
+                return
+            fields = {
+                "remote_addr": atoms["h"],
+                "method": atoms["m"],
+                "path": atoms["U"],
+                "query": atoms["q"],
+                "status": status,
+                "bytes": atoms["B"],
+                "duration_us": atoms["D"],
+                "trace_id": environ.get("HTTP_X_REQUEST_ID"),
+                "sample_rate": ACCESS_LOG_SAMPLE_RATE if status < 400 else 1.0,
+            }
+            self.access_log.info("access", extra=fields)
+        except Exception:
+            self.exception("access log 기록 실패")
+
+
+logger_class = JsonAccessLogger
+
+# gunicorn 기본값(CONFIG_DEFAULTS)에 update 되므로 loggers 는 error/access 둘 다 지정
+logconfig_dict = {
+    "formatters": {
+        "generic": {
+            "class": "logging.Formatter",
+            "format": "%(asctime)s [%(process)d] [%(levelname)s] %(message)s",
+            "datefmt": "[%Y-%m-%d %H:%M:%S %z]",
+        },
+    },
+    "handlers": {
+        "access_queue": {
+            "()": _access_queue_handler,
+        },
+        "error_console": {
+            "class": "logging.StreamHandler",
+            "formatter": "generic",
+            "stream": "ext://sys.stderr",
+        },
+    },
+    "loggers": {
+        "gunicorn.access": {
+            "handlers": ["access_queue"],
+            "level": "INFO",
+            "propagate": False,
+            "qualname": "gunicorn.access",
+        },
+        "gunicorn.error": {
+            "handlers": ["error_console"],
+            "level": "INFO",
+            "propagate": False,
+            "qualname": "gunicorn.error",
+        },
+    },
+    # 앱/라이브러리(google-auth, grpc, urllib3 등) 로그는 stderr 로, WARNING 이상만
+    "root": {"handlers": ["error_console"], "level": "WARNING"},
+}
@@ -0,0 +1,153 @@
+import pytest
+import importlib.util
+import io
+import json
+import logging
+import os
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from gunicorn.config import Config
+
+# gunicorn.conf.py 는 파일명에 '.' 이 있어 import 문으로 불러올 수 없으므로 경로로 로드
+_CONF_PATH = os.path.join(os.path.dirname(__file__), '..', 'gunicorn.conf.py')
+_spec = importlib.util.spec_from_file_location('gunicorn_conf', _CONF_PATH)
+gunicorn_conf = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gunicorn_conf)
+
+
+class TestPreRequest:
+    """pre_request 훅의 X-Request-ID 처리 테스트"""
+
+    def make_req(self, headers):
+        req = Mock()
+        req.method = 'GET'
+        req.path = '/diary'
+        req.headers = list(headers)
+        return req
+
+    def request_ids(self, req):
+        return [v for k, v in req.headers if k == 'X-REQUEST-ID']
+
+    def test_valid_id_is_kept(self):
+        """형식이 올바른 요청 ID는 그대로 유지"""
+        req = self.make_req([('HOST', 'x'), ('X-REQUEST-ID', 'abc-123')])
+
+        gunicorn_conf.pre_request(Mock(), req)
+
+        assert self.request_ids(req) == ['abc-123']
+        assert ('HOST', 'x') in req.headers
+
+    def test_missing_id_is_generated(self):
+        """요청 ID가 없으면 새로 발급"""
+        req = self.make_req([('HOST', 'x')])
+
+        gunicorn_conf.pre_request(Mock(), req)
+
+        ids = self.request_ids(req)
+        assert len(ids) == 1
+        assert len(ids[0]) == 32
+
+    def test_invalid_id_is_replaced(self):
+        """역슬래시/따옴표/개행이 포함된 ID는 새 ID로 교체"""
+        bad = 'bad"\\id\n{"x":1}'
+        req = self.make_req([('X-REQUEST-ID', bad)])
+
+        gunicorn_conf.pre_request(Mock(), req)
+
+        ids = self.request_ids(req)
+        assert len(ids) == 1
+        assert ids[0] != bad
+        assert gunicorn_conf._REQUEST_ID_RE.match(ids[0])
+
+    def test_duplicate_ids_are_collapsed(self):
+        """중복된 요청 ID 헤더는 하나로 정리"""
+        req = self.make_req([('X-REQUEST-ID', 'a'), ('X-REQUEST-ID', 'b')])
+
+        gunicorn_conf.pre_request(Mock(), req)
+
+        ids = self.request_ids(req)
+        assert len(ids) == 1
+        assert ids[0] not in ('a', 'b')
+
+
+class TestJsonAccessLogger:
+    """JsonAccessLogger access log 출력 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행되는 설정"""
+        self.logger = gunicorn_conf.JsonAccessLogger(Config())
+        self.stream = io.StringIO()
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(gunicorn_conf.json_formatter())
+        self.logger.access_log.handlers = [handler]
+        self.logger.access_log.propagate = False
+
+    def access(self, path='/diary', status='200 OK', query='', request_id='abc-123'):
+        resp = Mock()
+        resp.status = status
+        resp.sent = 12
+        resp.headers = []
+        req = Mock()
+        req.headers = [('X-REQUEST-ID', request_id)]
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'RAW_URI': '/raw',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1',
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'HTTP_X_REQUEST_ID': request_id,
+        }
+        self.logger.access(resp, req, environ, timedelta(microseconds=3400))
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_record_is_json_with_expected_fields(self):
+        """역슬래시/개행이 포함된 경로도 JSON 한 줄로 출력"""
+        path = '/diary\\x\n{"a":1}'
+
+        lines = self.access(path=path, query='q="\\')
+
+        assert len(lines) == 1
+        record = lines[0]
+        assert record['message'] == 'access'
+        assert record['path'] == path
+        assert record['query'] == 'q="\\'
+        assert record['method'] == 'GET'
+        assert record['status'] == 200
+        assert record['bytes'] == 12
+        assert record['duration_us'] == 3400
+        assert record['trace_id'] == 'abc-123'
+        assert record['remote_addr'] == '127.0.0.1'
+
+    def test_health_is_skipped(self):
+        """기본 설정에서 /health 성공 응답은 기록하지 않음"""
+        assert self.access(path='/health') == []
+
+    def test_health_error_is_logged(self):
+        """/health 라도 5xx 응답은 기록"""
+        lines = self.access(path='/health', status='503 Service Unavailable')
+
+        assert len(lines) == 1
+        assert lines[0]['status'] == 503
+
+    @patch.object(gunicorn_conf, 'ACCESS_LOG_SAMPLE_RATE', 0.0)
+    def test_sampling_drops_success_keeps_errors(self):
+        """샘플링 비율 0 이면 2xx 는 제외, 4xx/5xx 는 기록"""
+        assert self.access(path='/ChatAI') == []
+
+        lines = self.access(path='/ChatAI', status='500 INTERNAL SERVER ERROR')
+        assert len(lines) == 1
+        assert lines[0]['sample_rate'] == 1.0
+
+    def test_invalid_status_does_not_raise(self):
+        """status 파싱 실패는 요청 처리로 전파되지 않고 error log 로 기록"""
+        with patch.object(self.logger, 'exception') as mock_exception:
+            lines = self.access(status='???')
+
+        assert lines == []
+        mock_exception.assert_called_once()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])